@@ -50,6 +50,12 @@ MODEL_CONFIG = {
     }
 }
 
+# 跨运行持久化的状态目录（公告游标、K 线库等），GitHub Actions 中通过 actions/cache 保留
+STATE_DIR = os.environ.get(
+    "REPORT_STATE_DIR",
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), "state"),
+)
+
 if not MY_MAIL or "你的QQ邮箱" in MY_MAIL:
     raise RuntimeError("请先配置 MY_MAIL")
 if not MY_PASS or "SMTP授权码" in MY_PASS:
@@ -62,15 +68,55 @@ if not current_config["api_key"] or "YOUR_" in current_config["api_key"]:
     raise RuntimeError(f"请先在 MODEL_CONFIG 中填入 {PROVIDER} 的 api_key")
 
 
+def load_state(name, default):
+    path = os.path.join(STATE_DIR, name)
+    if not os.path.exists(path):
+        return default
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except Exception as e:
+        print(f"⚠️ 读取状态文件 {name} 失败: {e}")
+        return default
+
+
+def save_state(name, data):
+    path = os.path.join(STATE_DIR, name)
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp_path = path + ".tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(data, f, ensure_ascii=False, indent=1)
+        os.replace(tmp_path, path)
+    except Exception as e:
+        print(f"⚠️ 保存状态文件 {name} 失败: {e}")
+
+
 def gen_eastmoney_secid(code: str) -> str:
     if code.startswith("6"):
         return f"1.{code}"
     return f"0.{code}"
 
 
-def get_market_data(stock_code, stock_name):
-    print(f"📡 [{stock_name}] 正在抓取行情...")
-    secid = gen_eastmoney_secid(stock_code)
+# 日K线抓取条数（同时用于计算 Beta / 相关系数等相对强弱指标）
+KLINE_LIMIT = 120
+
+# 对比基准：大盘指数（每次运行只抓取一次，所有标的共用）
+BENCHMARK_INDEXES = [
+    ("1.000001", "上证指数"),
+    ("0.399001", "深证成指"),
+    ("1.000300", "沪深300"),
+]
+
+# 本次运行内的 K 线缓存，key 为 (secid, lmt)
+_KLINE_CACHE = {}
+
+
+def fetch_klines(secid, label, lmt=KLINE_LIMIT):
+    cache_key = (secid, lmt)
+    if cache_key in _KLINE_CACHE:
+        return _KLINE_CACHE[cache_key]
+
     url = "https://push2his.eastmoney.com/api/qt/stock/kline/get"
     params = {
         "secid": secid,
@@ -80,7 +126,7 @@ def get_market_data(stock_code, stock_name):
         "fqt": "1",
         "beg": "0",
         "end": "20500101",
-        "lmt": "60",
+        "lmt": str(lmt),
     }
     headers = {
         "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
@@ -96,17 +142,25 @@ def get_market_data(stock_code, stock_name):
             last_exc = e
         time.sleep(1.5)
     else:
-        raise RuntimeError(f"[{stock_name}] 行情接口连接失败: {last_exc}")
-    
+        raise RuntimeError(f"[{label}] 行情接口连接失败: {last_exc}")
+
     data = r.json()
     if "data" not in data or not data["data"] or "klines" not in data["data"]:
-        raise RuntimeError(f"[{stock_name}] 东方财富返回数据不完整")
-    
-    klines = data["data"]["klines"]
-    if len(klines) < 21:
+        raise RuntimeError(f"[{label}] 东方财富返回数据不完整")
+
+    rows = [k.split(",") for k in data["data"]["klines"]]
+    _KLINE_CACHE[cache_key] = rows
+    return rows
+
+
+def get_market_data(stock_code, stock_name):
+    print(f"📡 [{stock_name}] 正在抓取行情...")
+    secid = gen_eastmoney_secid(stock_code)
+    rows = fetch_klines(secid, stock_name)
+    if len(rows) < 21:
         raise RuntimeError(f"[{stock_name}] 历史数据不足 21 条")
-    
-    last21 = [k.split(",") for k in klines[-21:]]
+
+    last21 = rows[-21:]
     last20 = last21[-20:]
     closes = [float(k[2]) for k in last20]
     ma5 = sum(closes[-5:]) / 5
@@ -134,7 +188,448 @@ def get_market_data(stock_code, stock_name):
         "MA10": ma10,
         "MA20": ma20,
         "最新价": float(today[2]),
+        "收盘序列": [(k[0], float(k[2])) for k in rows],
+    }
+
+
+def get_stock_industry(stock_code):
+    # f127: 所属行业名称, f198: 行业板块代码 (如 BK0465)
+    secid = gen_eastmoney_secid(stock_code)
+    url = "https://push2.eastmoney.com/api/qt/stock/get"
+    params = {
+        "secid": secid,
+        "fields": "f57,f127,f198",
+        "invt": "2",
+        "fltt": "2",
+    }
+    try:
+        r = requests.get(url, params=params, timeout=5)
+        if r.status_code == 200:
+            data = r.json()
+            if "data" in data and data["data"]:
+                board_code = str(data["data"].get("f198") or "")
+                if board_code.startswith("BK"):
+                    return {
+                        "board_code": board_code,
+                        "board_name": data["data"].get("f127") or board_code,
+                    }
+    except Exception as e:
+        print(f"⚠️ [{stock_code}] 行业板块信息抓取失败: {e}")
+    return None
+
+
+BOARD_PEERS_PAGE_SIZE = 100
+BOARD_PEERS_MAX_PAGES = 20
+
+
+def get_board_peers(board_code):
+    # 行业板块成分股的 60 日涨跌幅（f24），用于板块内相对强弱排名。
+    # clist 接口限制单页条数，需按 pn 翻页直到取满 total；未取全时返回 None，避免排名失真
+    url = "https://push2.eastmoney.com/api/qt/clist/get"
+    params = {
+        "pz": str(BOARD_PEERS_PAGE_SIZE),
+        "po": "1",
+        "np": "1",
+        "fltt": "2",
+        "invt": "2",
+        "fid": "f24",
+        "fs": f"b:{board_code}",
+        "fields": "f12,f14,f24",
     }
+    peers = {}
+    received = 0
+    try:
+        for pn in range(1, BOARD_PEERS_MAX_PAGES + 1):
+            params["pn"] = str(pn)
+            r = requests.get(url, params=params, timeout=10)
+            if r.status_code != 200:
+                raise RuntimeError(f"HTTP {r.status_code}")
+            data = r.json()
+            if "data" not in data or not data["data"] or not data["data"].get("diff"):
+                break
+            total = data["data"].get("total") or 0
+            diff = data["data"]["diff"]
+            if isinstance(diff, dict):
+                diff = list(diff.values())
+            received += len(diff)
+            for item in diff:
+                chg_60 = item.get("f24")
+                if isinstance(chg_60, (int, float)):
+                    peers[str(item.get("f12"))] = float(chg_60)
+            # 缺少 total 时以不满一页作为结束标志
+            if (total and received >= total) or (not total and len(diff) < BOARD_PEERS_PAGE_SIZE):
+                return peers
+    except Exception as e:
+        print(f"⚠️ [{board_code}] 板块成分股抓取失败: {e}")
+        return None
+    print(f"⚠️ [{board_code}] 板块成分股未取全 ({received} 条)，跳过板块内排名")
+    return None
+
+
+def get_benchmark_data(stock_codes):
+    """
+    Fetch benchmark series once per run: broad indexes plus every
+    industry board the watchlist belongs to.
+    """
+    print("📡 正在抓取对比基准（指数与行业板块）...")
+    series = {}
+    for secid, name in BENCHMARK_INDEXES:
+        try:
+            series[name] = [(k[0], float(k[2])) for k in fetch_klines(secid, name)]
+        except Exception as e:
+            print(f"⚠️ [{name}] 基准行情抓取失败: {e}")
+
+    industries = {}
+    boards = {}
+    for code in stock_codes:
+        industry = get_stock_industry(code)
+        if not industry:
+            continue
+        industries[code] = industry
+        board_code = industry["board_code"]
+        if board_code in boards:
+            continue
+        board = {"name": industry["board_name"], "series": None, "peers": None}
+        try:
+            rows = fetch_klines(f"90.{board_code}", industry["board_name"])
+            board["series"] = [(k[0], float(k[2])) for k in rows]
+        except Exception as e:
+            print(f"⚠️ [{industry['board_name']}] 板块行情抓取失败: {e}")
+        board["peers"] = get_board_peers(board_code)
+        boards[board_code] = board
+
+    return {"indexes": series, "industries": industries, "boards": boards}
+
+
+def _aligned_returns(series, dates):
+    # 将 (日期, 收盘) 序列对齐到统一日期轴，返回逐日收益率（缺失为 None）
+    closes = dict(series)
+    returns = []
+    prev = None
+    for d in dates:
+        cur = closes.get(d)
+        if cur is not None and prev is not None and prev > 0:
+            returns.append(cur / prev - 1)
+        else:
+            returns.append(None)
+        if cur is not None:
+            prev = cur
+    return returns
+
+
+def _period_return(series, dates, n):
+    # 区间按统一日期轴计算：期末日无 K 线（如停牌）返回 None，期初收盘向前填充
+    if len(dates) <= n or not series or series[-1][0] != dates[-1]:
+        return None
+    start_date = dates[-1 - n]
+    start_close = None
+    for d, close in series:
+        if d > start_date:
+            break
+        start_close = close
+    if not start_close or start_close <= 0:
+        return None
+    return series[-1][1] / start_close - 1
+
+
+def _beta_corr(stock_rets, bench_rets):
+    pairs = [(s, b) for s, b in zip(stock_rets, bench_rets) if s is not None and b is not None]
+    if len(pairs) < 20:
+        return None, None
+    n = len(pairs)
+    mean_s = sum(p[0] for p in pairs) / n
+    mean_b = sum(p[1] for p in pairs) / n
+    cov = sum((s - mean_s) * (b - mean_b) for s, b in pairs) / (n - 1)
+    var_s = sum((s - mean_s) ** 2 for s, _ in pairs) / (n - 1)
+    var_b = sum((b - mean_b) ** 2 for _, b in pairs) / (n - 1)
+    if var_b <= 0 or var_s <= 0:
+        return None, None
+    return cov / var_b, cov / (var_s * var_b) ** 0.5
+
+
+def compute_relative_strength(infos, benchmarks, periods=(20, 60)):
+    """
+    Excess return, beta, correlation and RS rank for every stock in one pass
+    over a shared date axis.
+    """
+    index_series = benchmarks.get("indexes", {})
+    boards = benchmarks.get("boards", {})
+    industries = benchmarks.get("industries", {})
+
+    all_series = [info["收盘序列"] for info in infos]
+    all_series += list(index_series.values())
+    all_series += [b["series"] for b in boards.values() if b["series"]]
+    dates = sorted({d for s in all_series for d, _ in s})
+
+    bench_rets = {name: _aligned_returns(s, dates) for name, s in index_series.items()}
+    bench_period = {
+        name: {n: _period_return(s, dates, n) for n in periods} for name, s in index_series.items()
+    }
+    board_rets = {}
+    board_period = {}
+    for board_code, board in boards.items():
+        if board["series"]:
+            board_rets[board_code] = _aligned_returns(board["series"], dates)
+            board_period[board_code] = {n: _period_return(board["series"], dates, n) for n in periods}
+
+    # 自选股内部按最长周期涨幅排名
+    rank_period = periods[-1]
+    watch_returns = {
+        info["代码"]: _period_return(info["收盘序列"], dates, rank_period) for info in infos
+    }
+    ranked = sorted(
+        (code for code, r in watch_returns.items() if r is not None),
+        key=lambda c: watch_returns[c],
+        reverse=True,
+    )
+
+    results = {}
+    for info in infos:
+        code = info["代码"]
+        stock_rets = _aligned_returns(info["收盘序列"], dates)
+        stock_period = {n: _period_return(info["收盘序列"], dates, n) for n in periods}
+
+        rows = []
+        targets = [(name, bench_rets[name], bench_period[name]) for name in index_series]
+        industry = industries.get(code)
+        if industry and industry["board_code"] in board_rets:
+            board_code = industry["board_code"]
+            targets.append(
+                (f"{industry['board_name']}板块", board_rets[board_code], board_period[board_code])
+            )
+        for name, rets, period_map in targets:
+            beta, corr = _beta_corr(stock_rets, rets)
+            excess = {}
+            for n in periods:
+                if stock_period[n] is not None and period_map[n] is not None:
+                    excess[n] = stock_period[n] - period_map[n]
+                else:
+                    excess[n] = None
+            rows.append({"基准": name, "超额收益": excess, "Beta": beta, "相关系数": corr})
+
+        # 板块内排名基于东方财富的 60 日涨跌幅 (f24)，本股 f24 缺失时用本地 K 线补齐；
+        # 成分股列表抓取失败或未取全时不给出排名
+        peer_rank = None
+        board_peers = boards.get(industry["board_code"], {}).get("peers") if industry else None
+        if board_peers:
+            peers = dict(board_peers)
+            own_60 = _period_return(info["收盘序列"], dates, 60)
+            if own_60 is not None:
+                peers.setdefault(code, own_60 * 100)
+            if code in peers:
+                ordered = sorted(peers.values(), reverse=True)
+                peer_rank = (ordered.index(peers[code]) + 1, len(ordered))
+
+        results[code] = {
+            "区间涨幅": stock_period,
+            "对比": rows,
+            "自选排名": (ranked.index(code) + 1, len(ranked)) if code in ranked else None,
+            "板块排名": peer_rank,
+            "行业": industry["board_name"] if industry else None,
+        }
+    return results
+
+
+def format_relative_strength(rs, periods=(20, 60)):
+    if not rs:
+        return ""
+
+    def pct(v):
+        return f"{v * 100:+.2f}%" if v is not None else "N/A"
+
+    def num(v):
+        return f"{v:.2f}" if v is not None else "N/A"
+
+    text = "【相对强弱（对比大盘指数与行业板块）】\n"
+    text += "    - 区间涨幅：" + "，".join(f"近{n}日 {pct(rs['区间涨幅'][n])}" for n in periods) + "\n"
+    for row in rs["对比"]:
+        excess = "，".join(f"近{n}日超额 {pct(row['超额收益'][n])}" for n in periods)
+        text += f"    - 对比{row['基准']}：{excess}，Beta={num(row['Beta'])}，相关系数={num(row['相关系数'])}\n"
+    if rs["自选排名"]:
+        rank, total = rs["自选排名"]
+        text += f"    - 自选股内近{periods[-1]}日强弱排名：第 {rank}/{total}\n"
+    if rs["板块排名"]:
+        rank, total = rs["板块排名"]
+        text += f"    - {rs['行业']}板块内近60日强弱排名：第 {rank}/{total}\n"
+    return text
+
+
+# 本地 K 线库：state/klines/<secid>.json，首次运行抓取长历史，之后增量合并
+KLINE_HISTORY_LIMIT = 1250   # 约 5 年日 K
+
+# 回测：前瞻收益周期（交易日）与信号库，方向 1 为看多、-1 为看空
+BACKTEST_HORIZONS = (1, 5, 10, 20)
+BACKTEST_SIGNALS = [
+    ("MA5上穿MA20", 1),
+    ("MA5下穿MA20", -1),
+    ("有效站上MA20", 1),
+    ("有效跌破MA20", -1),
+    ("放量突破20日高点", 1),
+    ("放量跌破20日低点", -1),
+    ("看涨吞没", 1),
+    ("看跌吞没", -1),
+    ("启明星", 1),
+    ("黄昏星", -1),
+]
+
+
+def load_bar_history(stock_code, stock_name):
+    secid = gen_eastmoney_secid(stock_code)
+    name = f"klines/{secid}.json"
+    stored = load_state(name, [])
+    recent = fetch_klines(secid, stock_name)
+
+    # 前复权价格在每次除权除息后都会整体改写（小额分红也会），重叠区间收盘价有任何变化都需重新抓取全量历史
+    # 库中最后一根 K 线可能是盘中未收盘数据，不参与比较，合并时直接被覆盖
+    refetch = not stored
+    if stored and recent:
+        # 未被重新复权的 K 线会原样返回相同的收盘价字符串，任何差异（哪怕 0.01）都视为已重新复权
+        stored_close = {k[0]: k[2] for k in stored[:-1]}
+        overlap = [k for k in recent if k[0] in stored_close]
+        if not overlap or any(k[2] != stored_close[k[0]] for k in overlap):
+            refetch = True
+
+    if refetch:
+        print(f"📚 [{stock_name}] 正在抓取完整历史 K 线...")
+        bars = fetch_klines(secid, stock_name, lmt=KLINE_HISTORY_LIMIT)
+    else:
+        merged = {k[0]: k for k in stored}
+        merged.update({k[0]: k for k in recent})
+        bars = [merged[d] for d in sorted(merged)]
+    save_state(name, bars)
+    return bars
+
+
+def _rolling_mean(values, window):
+    out = [None] * len(values)
+    total = 0.0
+    for i, v in enumerate(values):
+        total += v
+        if i >= window:
+            total -= values[i - window]
+        if i >= window - 1:
+            out[i] = total / window
+    return out
+
+
+def _signal_events(bars):
+    # 按整段历史一次性计算全部信号，返回每个信号的触发位置（K 线下标）
+    o = [float(k[1]) for k in bars]
+    c = [float(k[2]) for k in bars]
+    h = [float(k[3]) for k in bars]
+    lo = [float(k[4]) for k in bars]
+    v = [float(k[5]) for k in bars]
+    n = len(bars)
+    ma5 = _rolling_mean(c, 5)
+    ma20 = _rolling_mean(c, 20)
+    vol20 = _rolling_mean(v, 20)
+    above = [m is not None and x > m for x, m in zip(c, ma20)]
+
+    events = {name: [] for name, _ in BACKTEST_SIGNALS}
+    for i in range(22, n):
+        if ma5[i - 1] <= ma20[i - 1] and ma5[i] > ma20[i]:
+            events["MA5上穿MA20"].append(i)
+        elif ma5[i - 1] >= ma20[i - 1] and ma5[i] < ma20[i]:
+            events["MA5下穿MA20"].append(i)
+
+        # “有效”站上/跌破：连续 3 日收在 MA20 同侧，且此前一日在另一侧
+        if above[i] == above[i - 1] == above[i - 2] != above[i - 3]:
+            events["有效站上MA20" if above[i] else "有效跌破MA20"].append(i)
+
+        # 放量：成交量超过前 20 日均量 2 倍，同时突破/跌破前 20 日高低点
+        if v[i] > 2 * vol20[i - 1]:
+            if c[i] > max(h[i - 20:i]):
+                events["放量突破20日高点"].append(i)
+            elif c[i] < min(lo[i - 20:i]):
+                events["放量跌破20日低点"].append(i)
+
+        body0 = c[i] - o[i]
+        body1 = c[i - 1] - o[i - 1]
+        if body1 < 0 < body0 and o[i] <= c[i - 1] and c[i] >= o[i - 1]:
+            events["看涨吞没"].append(i)
+        elif body1 > 0 > body0 and o[i] >= c[i - 1] and c[i] <= o[i - 1]:
+            events["看跌吞没"].append(i)
+
+        # 星线形态：首日实体 >= 2%，次日实体不足首日 1/3 且跳空，第三日收复首日实体一半以上
+        body2 = c[i - 2] - o[i - 2]
+        if o[i - 2] > 0 and abs(body2) >= 0.02 * o[i - 2] and abs(body1) < abs(body2) / 3:
+            mid = (o[i - 2] + c[i - 2]) / 2
+            if body2 < 0 and max(o[i - 1], c[i - 1]) < c[i - 2] and body0 > 0 and c[i] > mid:
+                events["启明星"].append(i)
+            elif body2 > 0 and min(o[i - 1], c[i - 1]) > c[i - 2] and body0 < 0 and c[i] < mid:
+                events["黄昏星"].append(i)
+    return c, events
+
+
+def _new_backtest_stats():
+    return {
+        name: {"n": 0, "hits": {h: 0 for h in BACKTEST_HORIZONS},
+               "ret_sum": {h: 0.0 for h in BACKTEST_HORIZONS},
+               "count": {h: 0 for h in BACKTEST_HORIZONS}}
+        for name, _ in BACKTEST_SIGNALS
+    }
+
+
+def run_signal_backtest(histories):
+    """
+    Evaluate the signal library over every stored bar history, returning
+    per-stock and watchlist-pooled hit rates and mean forward returns.
+    """
+    per_stock = {}
+    pooled = _new_backtest_stats()
+    active = {}
+    for code, bars in histories.items():
+        if len(bars) < 30:
+            continue
+        closes, events = _signal_events(bars)
+        n = len(closes)
+        stats = _new_backtest_stats()
+        for name, direction in BACKTEST_SIGNALS:
+            for i in events[name]:
+                base = closes[i]
+                for target in (stats[name], pooled[name]):
+                    target["n"] += 1
+                for h in BACKTEST_HORIZONS:
+                    if i + h >= n or base <= 0:
+                        continue
+                    ret = closes[i + h] / base - 1
+                    hit = ret * direction > 0
+                    for target in (stats[name], pooled[name]):
+                        target["count"][h] += 1
+                        target["ret_sum"][h] += ret
+                        if hit:
+                            target["hits"][h] += 1
+        per_stock[code] = stats
+        active[code] = [name for name, _ in BACKTEST_SIGNALS if events[name] and events[name][-1] == n - 1]
+    return {"per_stock": per_stock, "pooled": pooled, "active": active}
+
+
+def format_backtest_summary(backtest, stock_code):
+    stats = backtest.get("per_stock", {}).get(stock_code)
+    if not stats:
+        return ""
+    pooled = backtest["pooled"]
+    active = backtest["active"].get(stock_code, [])
+
+    def describe(s):
+        parts = []
+        for h in BACKTEST_HORIZONS:
+            if s["count"][h]:
+                hit = s["hits"][h] / s["count"][h] * 100
+                mean = s["ret_sum"][h] / s["count"][h] * 100
+                parts.append(f"{h}日胜率{hit:.0f}%/均值{mean:+.2f}%")
+        return "，".join(parts) if parts else "样本不足"
+
+    text = "【历史信号回测（基于本地存储的全部日 K 线）】\n"
+    text += f"    - 今日触发信号：{'、'.join(active) if active else '无'}\n"
+    for name, direction in BACKTEST_SIGNALS:
+        s = stats[name]
+        if not s["n"]:
+            continue
+        side = "看多" if direction > 0 else "看空"
+        text += f"    - {name}（{side}）：本股 {s['n']} 次，{describe(s)}；"
+        text += f"自选池 {pooled[name]['n']} 次，{describe(pooled[name])}\n"
+    return text
 
 
 def call_gemini_http(prompt: str) -> str:
@@ -179,34 +674,163 @@ def call_openai_compatible_api(prompt: str) -> str:
         raise RuntimeError(f"API 返回格式异常: {data}")
 
 
-def get_stock_news(stock_code, stock_name):
-    log_to_file(f"📰 [{stock_name}] 正在抓取新闻资讯...")
-    news_content = ""
-    
-    # 1. 抓取公告 (EastMoney)
+# 公告增量抓取：每只股票记录游标（最新公告日期）与已读公告 ID
+ANNOUNCEMENT_INDEX_FILE = "announcement_index.json"
+ANN_BATCH_SIZE = 10       # 每次请求 stock_list 中合并的股票数
+ANN_PAGE_SIZE = 50
+ANN_MAX_PAGES = 10
+ANN_BOOTSTRAP_DAYS = 7    # 首次运行（无游标）时回看的天数
+ANN_SEEN_LIMIT = 500
+ANN_RECENT_LIMIT = 5
+ANN_PROMPT_LIMIT = 10     # 写入 prompt 的新公告条数上限
+
+_ANNOUNCEMENT_INDEX = None
+# 本次运行的公告结果，key 为股票代码，value 为 {"new": [...], "recent": [...], "failed": bool}
+_ANNOUNCEMENT_FEED = {}
+# 待提交的游标更新，仅在该股票报告生成且邮件发送成功后写入索引
+_ANNOUNCEMENT_PENDING = {}
+
+
+def _get_announcement_index():
+    global _ANNOUNCEMENT_INDEX
+    if _ANNOUNCEMENT_INDEX is None:
+        _ANNOUNCEMENT_INDEX = load_state(ANNOUNCEMENT_INDEX_FILE, {})
+    return _ANNOUNCEMENT_INDEX
+
+
+def commit_announcement_cursors(stock_codes):
+    index = _get_announcement_index()
+    for code in stock_codes:
+        if code in _ANNOUNCEMENT_PENDING:
+            index[code] = _ANNOUNCEMENT_PENDING.pop(code)
+
+
+def save_announcement_index():
+    if _ANNOUNCEMENT_INDEX is not None:
+        save_state(ANNOUNCEMENT_INDEX_FILE, _ANNOUNCEMENT_INDEX)
+
+
+def _fetch_announcement_page(codes, page_index):
     url_ann = "https://np-anotice-stock.eastmoney.com/api/security/ann"
     params_ann = {
         "sr": "-1",
-        "page_size": "5",
-        "page_index": "1",
+        "page_size": str(ANN_PAGE_SIZE),
+        "page_index": str(page_index),
         "ann_type": "A",
         "client_source": "web",
-        "stock_list": stock_code,
+        "stock_list": ",".join(codes),
         "f_node": "0",
         "s_node": "0",
     }
-    try:
-        r = requests.get(url_ann, params=params_ann, timeout=5)
-        if r.status_code == 200:
-            data = r.json()
-            if "data" in data and "list" in data["data"]:
-                news_content += "【近期重要公告】\n"
-                for item in data["data"]["list"][:3]:
-                    title = item.get("title", "")
-                    date = item.get("notice_date", "")[:10]
-                    news_content += f"- {date}: {title}\n"
-    except Exception as e:
-        print(f"⚠️ 公告抓取失败: {e}")
+    r = requests.get(url_ann, params=params_ann, timeout=10)
+    if r.status_code != 200:
+        raise RuntimeError(f"HTTP {r.status_code}")
+    data = r.json()
+    if "data" not in data or not data["data"]:
+        return []
+    return data["data"].get("list") or []
+
+
+def prefetch_announcements(stock_codes):
+    """
+    Fetch announcements newer than each stock's cursor, batching several
+    codes per request and paging until every cursor is reached.
+    """
+    index = _get_announcement_index()
+    today = str(datetime.date.today())
+    bootstrap_date = str(datetime.date.today() - datetime.timedelta(days=ANN_BOOTSTRAP_DAYS))
+    codes = [c for c in stock_codes if c not in _ANNOUNCEMENT_FEED]
+
+    for start in range(0, len(codes), ANN_BATCH_SIZE):
+        batch = codes[start:start + ANN_BATCH_SIZE]
+        entries = {}
+        for code in batch:
+            entry = index.get(code) or {"cursor": "", "seen": [], "recent": []}
+            entries[code] = entry
+            _ANNOUNCEMENT_FEED[code] = {"new": [], "recent": list(entry["recent"]), "failed": True}
+        cutoffs = {code: entries[code]["cursor"] or bootstrap_date for code in batch}
+        seen = {code: set(entries[code]["seen"]) for code in batch}
+        min_cutoff = min(cutoffs.values())
+        # 整批全部页抓取成功后才写入 _ANNOUNCEMENT_FEED，避免部分结果被当作新公告
+        batch_new = {code: [] for code in batch}
+        complete = True
+
+        try:
+            for page_index in range(1, ANN_MAX_PAGES + 1):
+                items = _fetch_announcement_page(batch, page_index)
+                oldest = None
+                for item in items:
+                    art_code = item.get("art_code", "")
+                    date = (item.get("notice_date") or "")[:10]
+                    oldest = date if oldest is None else min(oldest, date)
+                    related = {c.get("stock_code") for c in item.get("codes") or []}
+                    for code in batch:
+                        if code not in related or not art_code:
+                            continue
+                        # 游标当天的公告可能在上次运行后才发布，需再用已读 ID 去重
+                        if date < cutoffs[code] or art_code in seen[code]:
+                            continue
+                        seen[code].add(art_code)
+                        batch_new[code].append({
+                            "art_code": art_code,
+                            "date": date,
+                            "title": item.get("title", ""),
+                        })
+                if len(items) < ANN_PAGE_SIZE or (oldest and oldest < min_cutoff):
+                    break
+            else:
+                # 达到翻页上限仍未回溯到游标，更早的公告尚未读取
+                complete = False
+                print(f"⚠️ 公告翻页达到上限 ({','.join(batch)})，本次不推进游标")
+        except Exception as e:
+            print(f"⚠️ 公告抓取失败 ({','.join(batch)}): {e}")
+            continue
+
+        # 整批抓取成功后才生成待提交的游标，不直接修改索引。
+        # 游标记录本次检查的日期（而非最新公告日期），长期无公告的标的也会前移，
+        # 避免旧游标拖累整批翻页；翻页未读完时保持原游标，已读公告靠 seen 去重
+        for code in batch:
+            new_items = batch_new[code]
+            _ANNOUNCEMENT_FEED[code]["new"] = new_items
+            _ANNOUNCEMENT_FEED[code]["failed"] = False
+            entry = entries[code]
+            _ANNOUNCEMENT_PENDING[code] = {
+                "cursor": max([entry["cursor"], today] + [n["date"] for n in new_items]) if complete else entry["cursor"],
+                "seen": (entry["seen"] + [n["art_code"] for n in new_items])[-ANN_SEEN_LIMIT:],
+                "recent": (new_items + entry["recent"])[:ANN_RECENT_LIMIT],
+            }
+
+
+def get_new_announcement_count(stock_code):
+    return len(_ANNOUNCEMENT_FEED.get(stock_code, {}).get("new", []))
+
+
+def announcement_fetch_failed(stock_code):
+    return _ANNOUNCEMENT_FEED.get(stock_code, {}).get("failed", True)
+
+
+def get_stock_news(stock_code, stock_name):
+    log_to_file(f"📰 [{stock_name}] 正在抓取新闻资讯...")
+    news_content = ""
+
+    # 1. 公告 (EastMoney)，main 中已批量预取，单独调用时按需抓取
+    if stock_code not in _ANNOUNCEMENT_FEED:
+        prefetch_announcements([stock_code])
+    feed = _ANNOUNCEMENT_FEED.get(stock_code, {"new": [], "recent": [], "failed": True})
+    new_codes = {n["art_code"] for n in feed["new"]}
+    if feed["failed"]:
+        news_content += "【近期重要公告】（⚠️ 公告接口抓取失败，无法判断是否有新增公告）\n"
+    elif feed["new"]:
+        news_content += f"【近期重要公告】（🆕 自上次报告以来新增 {len(feed['new'])} 条）\n"
+        for item in feed["new"][:ANN_PROMPT_LIMIT]:
+            news_content += f"- 🆕【新公告】{item['date']}: {item['title']}\n"
+        if len(feed["new"]) > ANN_PROMPT_LIMIT:
+            news_content += f"- ……另有 {len(feed['new']) - ANN_PROMPT_LIMIT} 条新公告未列出\n"
+    else:
+        news_content += "【近期重要公告】（自上次报告以来无新增公告）\n"
+    older = [item for item in feed["recent"] if item["art_code"] not in new_codes]
+    for item in older[:3]:
+        news_content += f"- 【往期已报】{item['date']}: {item['title']}\n"
 
     # 2. 尝试抓取新浪财经个股资讯 (Sina Finance)
     # 既然直接抓取微博困难，我们抓取新浪财经的个股新闻列表，通常包含媒体报道
@@ -274,39 +898,167 @@ def get_weibo_posts(stock_name):
         return ""
 
 
-def get_x_tweets(stock_code, stock_name):
+# X(Twitter) 批量检索：多只标的合并为 OR 查询，结果按推文 ID 跨运行缓存
+X_API_BASE_URL = os.environ.get("X_API_BASE_URL", "https://api.twitter.com")
+X_BATCH_MODE = os.environ.get("X_BATCH_MODE", "1") != "0"
+X_QUERY_MAX_LEN = int(os.environ.get("X_QUERY_MAX_LEN", "512"))
+X_QUERY_SUFFIX = " lang:zh -is:retweet"
+X_PAGE_SIZE = 100
+X_MAX_PAGES = 3
+X_CACHE_DAYS = 7          # recent search 只覆盖最近 7 天
+X_TWEET_CACHE_FILE = "x_tweets.json"
+
+_X_CACHE = None
+# 本次运行已检索过的股票代码
+_X_FETCHED = set()
+
+
+def _get_x_cache():
+    global _X_CACHE
+    if _X_CACHE is None:
+        _X_CACHE = load_state(X_TWEET_CACHE_FILE, {"tweets": {}, "since_id": {}})
+    return _X_CACHE
+
+
+def _x_query(group):
+    terms = []
+    for stock_code, stock_name in group:
+        terms += [f"\"{stock_name}\"", f"\"{stock_code}\""]
+    return f"({' OR '.join(terms)}){X_QUERY_SUFFIX}"
+
+
+def build_x_query_groups(stocks):
+    """
+    Greedily pack stocks into OR-queries that fit within X_QUERY_MAX_LEN.
+    """
+    groups = []
+    current = []
+    for stock in stocks:
+        if current and (not X_BATCH_MODE or len(_x_query(current + [stock])) > X_QUERY_MAX_LEN):
+            groups.append(current)
+            current = []
+        current.append(stock)
+    if current:
+        groups.append(current)
+    return [(group, _x_query(group)) for group in groups]
+
+
+def _x_id_time(tweet_id):
+    # 推文 ID 为 snowflake，高位为毫秒时间戳（相对 2010-11-04 纪元）
+    ms = (int(tweet_id) >> 22) + 1288834974657
+    return datetime.datetime.fromtimestamp(ms / 1000, datetime.timezone.utc).strftime("%Y-%m-%dT%H:%M:%S")
+
+
+def _prune_x_cache(cache, active_queries=None):
+    # recent search 只接受 7 天内的 since_id，过期的游标与推文一并清理
+    cutoff = (datetime.datetime.now(datetime.timezone.utc) - datetime.timedelta(days=X_CACHE_DAYS)).strftime("%Y-%m-%dT%H:%M:%S")
+    cache["tweets"] = {
+        tid: t for tid, t in cache["tweets"].items() if t["created_at"] >= cutoff
+    }
+    cache["since_id"] = {
+        query: entry for query, entry in cache["since_id"].items()
+        if isinstance(entry, dict) and entry.get("time", "") >= cutoff
+        and (active_queries is None or query in active_queries)
+    }
+
+
+def prefetch_x_tweets(stocks, prune_queries=False):
     token = os.environ.get("X_BEARER_TOKEN")
     if not token:
-        return ""
-    print(f"🐦 [{stock_name}] 正在抓取 X(Twitter) 推文...")
-    url = "https://api.twitter.com/2/tweets/search/recent"
-    query = f"\"{stock_name}\" OR \"{stock_code}\" lang:zh -is:retweet"
-    params = {
-        "query": query,
-        "max_results": 10,
-        "tweet.fields": "created_at,lang"
-    }
+        return
+    cache = _get_x_cache()
+    # 传入完整自选列表时，顺便清理自选股变更后已不再使用的查询游标
+    _prune_x_cache(cache, {q for _, q in build_x_query_groups(stocks)} if prune_queries else None)
+    stocks = [(c, n) for c, n in stocks if c not in _X_FETCHED]
+    if not stocks:
+        save_state(X_TWEET_CACHE_FILE, cache)
+        return
+    url = f"{X_API_BASE_URL}/2/tweets/search/recent"
     headers = {
         "Authorization": f"Bearer {token}"
     }
-    try:
-        resp = requests.get(url, headers=headers, params=params, timeout=10)
-        if resp.status_code != 200:
-            print(f"⚠️ X API 返回状态码: {resp.status_code}")
-            return ""
-        data = resp.json()
-        tweets = data.get("data", [])
-        if not tweets:
-            return ""
-        content = "【Twitter(X) 近期相关推文摘要】\n"
-        for t in tweets[:5]:
-            text = t.get("text", "").replace("\n", " ")
-            created = t.get("created_at", "")
-            content += f"- {created}: {text}\n"
-        return content
-    except Exception as e:
-        print(f"⚠️ 抓取 X 推文失败: {e}")
+    calls = 0
+    rate_limited = False
+    for group, query in build_x_query_groups(stocks):
+        _X_FETCHED.update(c for c, _ in group)
+        if rate_limited:
+            continue
+        print(f"🐦 [{'、'.join(n for _, n in group)}] 正在抓取 X(Twitter) 推文...")
+        params = {
+            "query": query,
+            "max_results": X_PAGE_SIZE,
+            "tweet.fields": "created_at,lang",
+        }
+        since_id = cache["since_id"].get(query, {}).get("id")
+        if since_id:
+            params["since_id"] = since_id
+        newest_id = since_id
+        complete = True
+        try:
+            for _ in range(X_MAX_PAGES):
+                resp = requests.get(url, headers=headers, params=params, timeout=10)
+                calls += 1
+                if resp.status_code == 400 and "since_id" in params:
+                    # since_id 失效（如超出 7 天窗口），清除后不带 since_id 重试
+                    print("⚠️ X API 拒绝 since_id，已清除并重新检索")
+                    cache["since_id"].pop(query, None)
+                    del params["since_id"]
+                    newest_id = None
+                    resp = requests.get(url, headers=headers, params=params, timeout=10)
+                    calls += 1
+                if resp.status_code != 200:
+                    print(f"⚠️ X API 返回状态码: {resp.status_code}")
+                    # 429 表示额度耗尽，剩余分组直接使用缓存
+                    rate_limited = resp.status_code == 429
+                    complete = False
+                    break
+                data = resp.json()
+                meta = data.get("meta", {})
+                if meta.get("newest_id") and (not newest_id or int(meta["newest_id"]) > int(newest_id)):
+                    newest_id = meta["newest_id"]
+                # 按推文内容把结果分配回命中的股票
+                for t in data.get("data", []):
+                    text = t.get("text", "")
+                    matched = [c for c, n in group if n in text or c in text]
+                    if not matched:
+                        continue
+                    entry = cache["tweets"].setdefault(t["id"], {
+                        "text": text,
+                        "created_at": t.get("created_at", ""),
+                        "stocks": [],
+                    })
+                    entry["stocks"] = sorted(set(entry["stocks"]) | set(matched))
+                if not meta.get("next_token"):
+                    break
+                params["next_token"] = meta["next_token"]
+            else:
+                # 达到翻页上限仍有 next_token，说明还有更早的推文未读
+                complete = False
+            # 中途失败或未读完时不推进 since_id，下次运行重新覆盖这段时间
+            if complete and newest_id:
+                cache["since_id"][query] = {"id": newest_id, "time": _x_id_time(newest_id)}
+        except Exception as e:
+            print(f"⚠️ 抓取 X 推文失败: {e}")
+
+    _prune_x_cache(cache)
+    save_state(X_TWEET_CACHE_FILE, cache)
+    print(f"🐦 X API 本次调用 {calls} 次（{len(stocks)} 只标的）")
+
+
+def get_x_tweets(stock_code, stock_name):
+    if not os.environ.get("X_BEARER_TOKEN"):
+        return ""
+    if stock_code not in _X_FETCHED:
+        prefetch_x_tweets([(stock_code, stock_name)])
+    tweets = [t for t in _get_x_cache()["tweets"].values() if stock_code in t["stocks"]]
+    if not tweets:
         return ""
+    tweets.sort(key=lambda t: t["created_at"], reverse=True)
+    content = "【Twitter(X) 近期相关推文摘要】\n"
+    for t in tweets[:5]:
+        text = t["text"].replace("\n", " ")
+        content += f"- {t['created_at']}: {text}\n"
+    return content
 
 def get_stock_base_info(stock_code):
     # Fetch basic info like Total Shares
@@ -452,7 +1204,7 @@ def get_research_report_summary(stock_code):
     return "（暂无最新研报数据）"
 
 
-def generate_single_stock_report(info):
+def generate_single_stock_report(info, relative_strength_text="", backtest_text=""):
     stock_name = info["名称"]
     stock_code = info["代码"]
     
@@ -527,6 +1279,10 @@ def generate_single_stock_report(info):
     - 成交额：{info["成交额"]/100000000:.2f} 亿元，成交量：{info["成交量"]:.0f} 手，换手率：{info["换手率"]:.2f}%
     - 均线：MA5={info["MA5"]:.2f}，MA10={info["MA10"]:.2f}，MA20={info["MA20"]:.2f}
 
+    {relative_strength_text}
+
+    {backtest_text}
+
     【近期资讯与舆情输入】
     {news_data}
     {report_data}
@@ -553,14 +1309,14 @@ def generate_single_stock_report(info):
     <!-- 重点事件高亮区域 -->
     <div style="margin-bottom: 20px; padding: 15px; background-color: #fff3f3; border-left: 5px solid #e74c3c;">
         <h2 style="margin: 0; color: #e74c3c; font-size: 20px; font-weight: bold;">
-            🔥 今日最关键事件：[请在此处总结当日发生的最重要的一件事，如无重大事件则写“今日无重大消息，情绪主导”]
+            🔥 今日最关键事件：[请在此处总结当日发生的最重要的一件事，优先从“🆕【新公告】”中选取；如无重大事件则写“今日无重大消息，情绪主导”]
         </h2>
     </div>
 
     一、<h3>当日核心结论</h3>
     用 2~4 句简洁文字，总结：
     1) 今天股价和成交的核心变化是什么；
-    2) 该变化更多来自情绪波动，还是基本面或事件驱动；
+    2) 该变化更多来自情绪波动，还是基本面或事件驱动（请结合【相对强弱】数据判断：若与大盘/行业板块同步涨跌、超额收益接近 0，多为市场或板块 Beta 驱动；若显著跑赢或跑输基准，则更可能是个股事件或资金情绪驱动）；
     3) 对短期(1~2 周)和中期(3~6 个月)的观点是偏多、中性还是偏谨慎。
 
     二、<h3>当日交易与技术面</h3>
@@ -589,17 +1345,18 @@ def generate_single_stock_report(info):
 
     四、<h3>事件与风险跟踪（深度舆情分析）</h3>
     **重点部分：结合“公告”与“行情”推演情绪**
-    1) **舆情与事件梳理**：概括近期公告要点（如有），或指出“今日无重大公告，行情主要受市场情绪/板块轮动主导”。对你在本段引用的**每一条重要公告或具体事件**，务必在描述中明确标注【公告/事件日期】，例如“2026-01-15 公司发布……公告”。若引用微博或 Twitter(X) 等社交媒体中的具体观点或信息，请在句中或句后标注【发帖日期】，例如“（微博 2026-01-15）”、“（X 2026-01-15）”。
+    1) **舆情与事件梳理**：概括近期公告要点（如有）。标注“🆕【新公告】”的是自上次报告以来首次出现的公告，请优先解读；标注“【往期已报】”的仅作背景参考，不要当作今日新消息。若明确无新公告，请指出“今日无重大公告，行情主要受市场情绪/板块轮动主导”；若提示“公告接口抓取失败”，请说明公告数据缺失，不要据此断定无公告或行情由情绪主导。对你在本段引用的**每一条重要公告或具体事件**，务必在描述中明确标注【公告/事件日期】，例如“2026-01-15 公司发布……公告”。若引用微博或 Twitter(X) 等社交媒体中的具体观点或信息，请在句中或句后标注【发帖日期】，例如“（微博 2026-01-15）”、“（X 2026-01-15）”。
 2) **财务影响推演**：定性分析事件对公司【营收/利润/成本】的潜在影响（如无事件，则分析宏观/行业因素）。
 3) **盈利预期修正**：判断当前市场对公司未来的盈利预期是否发生变化。
 
     五、<h3>后续观察要点与策略思路</h3>
-    1) 给出 2~3 个需要重点观察的价格或技术信号（如“若有效跌破 MA20...”）；
+    1) 给出 2~3 个需要重点观察的价格或技术信号（如“若有效跌破 MA20...”），并引用【历史信号回测】中对应信号在本股及自选池的历史胜率与平均前瞻收益（如有），说明该信号过往是否可靠；样本次数过少（如少于 5 次）时需提示参考价值有限；
     2) 针对不同类型投资者（稳健型/激进型）给出简要策略建议。
 
     六、<h3>数据与信息来源及时间说明</h3>
     请在报告结尾补充一个简短的小节，列表形式列出本报告使用的主要数据与信息来源，并注明时间范围，例如：
     - 行情与成交数据：来自东方财富 K 线接口，数据截至 {info["日期"]} 收盘；
+    - 信号回测：基于本地存储的历史日 K 线（前复权）统计，不代表未来表现；
     - 公告与公司新闻：来自东方财富公告接口，主要引用近几日公告（以各公告原文日期为准）；
     - 社交媒体舆情：来自微博检索链接和 Twitter(X) API，内容为报告生成当日附近检索到的公开信息，引用具体观点时在文中已标注发帖日期。
 
@@ -647,6 +1404,7 @@ def send_mail(html_content):
             server.login(MY_MAIL, MY_PASS)
             server.sendmail(MY_MAIL, [MY_MAIL], msg.as_bytes())
         print("✅ 邮件发送成功")
+        return True
     except Exception as e:
         print(f"❌ 邮件发送失败: {repr(e)}")
         error_log = os.path.join(os.path.dirname(os.path.abspath(__file__)), "email_error.log")
@@ -655,6 +1413,7 @@ def send_mail(html_content):
                 f.write(f"{datetime.datetime.now()} 发送失败: {repr(e)}\n")
         except Exception:
             pass
+        return False
 
 
 def main():
@@ -673,6 +1432,27 @@ def main():
         print("❌ 未配置有效的股票列表")
         return
 
+    # 批量检索 X(Twitter)，多只标的合并查询以节省 API 额度
+    prefetch_x_tweets(stock_list, prune_queries=True)
+
+    # 批量增量抓取全部标的的公告，并在报告开头列出新公告分诊摘要
+    prefetch_announcements([code for code, _ in stock_list])
+    triage = [
+        f"{name}({code}) {get_new_announcement_count(code)} 条"
+        for code, name in stock_list
+        if get_new_announcement_count(code)
+    ]
+    failed = [f"{name}({code})" for code, name in stock_list if announcement_fetch_failed(code)]
+    if triage:
+        triage_text = "🆕 新公告：" + "，".join(triage)
+    elif len(failed) < len(stock_list):
+        triage_text = "🆕 新公告：" + ("其余标的" if failed else "") + "自上次报告以来无新增"
+    else:
+        triage_text = ""
+    if failed:
+        triage_text += (" | " if triage_text else "") + "⚠️ 公告接口抓取失败：" + "，".join(failed)
+    print(triage_text)
+
     full_report_html = f"""
     <html>
     <head>
@@ -685,16 +1465,54 @@ def main():
     <body>
         <h1>📈 自选品种追踪日报 ({datetime.date.today()})</h1>
         <p style="text-align: center;">模型: {PROVIDER} | 标的数量: {len(stock_list)}</p>
+        <p style="text-align: center; color: #e74c3c;">{triage_text}</p>
         <hr>
     """
 
+    # 先抓取全部标的行情，再统一计算相对强弱（基准序列每次运行只抓取一次）
+    market_data = {}
+    for code, name in stock_list:
+        try:
+            market_data[code] = get_market_data(code, name)
+        except Exception as e:
+            market_data[code] = e
+
+    infos = [v for v in market_data.values() if isinstance(v, dict)]
+    relative_strength = {}
+    if infos:
+        try:
+            benchmarks = get_benchmark_data([info["代码"] for info in infos])
+            relative_strength = compute_relative_strength(infos, benchmarks)
+        except Exception as e:
+            print(f"⚠️ 相对强弱计算失败: {e}")
+
+    # 基于本地 K 线库对全部标的一次性回测信号库
+    backtest = {}
+    histories = {}
+    for info in infos:
+        try:
+            histories[info["代码"]] = load_bar_history(info["代码"], info["名称"])
+        except Exception as e:
+            print(f"⚠️ [{info['名称']}] 历史 K 线加载失败: {e}")
+    if histories:
+        try:
+            backtest = run_signal_backtest(histories)
+        except Exception as e:
+            print(f"⚠️ 信号回测失败: {e}")
+
     success_count = 0
+    reported_codes = []
     for code, name in stock_list:
         try:
-            info = get_market_data(code, name)
-            report_segment = generate_single_stock_report(info)
+            info = market_data[code]
+            if isinstance(info, Exception):
+                raise info
+            rs_text = format_relative_strength(relative_strength.get(code))
+            bt_text = format_backtest_summary(backtest, code) if backtest else ""
+            report_segment = generate_single_stock_report(info, rs_text, bt_text)
             full_report_html += report_segment
             success_count += 1
+            reported_codes.append(code)
             # 避免API速率限制，稍作停顿
             time.sleep(2)
         except Exception as e:
@@ -715,7 +1533,10 @@ def main():
     """
 
     if success_count > 0:
-        send_mail(full_report_html)
+        # 仅对已生成报告的标的推进公告游标，且邮件发送失败时不保存，下次运行会重新标记为新公告
+        if send_mail(full_report_html):
+            commit_announcement_cursors(reported_codes)
+            save_announcement_index()
     else:
         print("❌ 没有成功生成任何股票的报告，跳过发送邮件")
     